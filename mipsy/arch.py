@@ -6,7 +6,7 @@ See README.md for usage and general information.
 """
 
 # application imports
-from mipsy.util import OpInfo
+from mipsy.util import InstructionSpec
 
 
 class MIPS(object):
@@ -34,24 +34,86 @@ class MIPS(object):
         '$a3'   : '00111', '$t7' : '01111', '$s7' : '10111', '$ra' : '11111',
     }
 
-    # Instruction to opcode mapping
+    # Instruction set specification, following the reference card (green sheet)
+    # Each row defines both the encoding (format, opcode, funct, fixed rt) and the
+    # assembler syntax (operand order, tokenizer). The operation tables used by
+    # the encoder are generated from this list; add new instructions here only.
+    instruction_set = [
+        #               mnemonic   fmt   opcode    funct     operands                  tokenizer
+        InstructionSpec('nop',     'R', '000000', '000000', ['rd', 'rs', 'rt'],       'nop'),
+
+        # R format
+        InstructionSpec('sll',     'R', '000000', '000000', ['rd', 'rt', 'shamt'],    'RI_type'),
+        InstructionSpec('srl',     'R', '000000', '000010', ['rd', 'rt', 'shamt'],    'RI_type'),
+        InstructionSpec('sra',     'R', '000000', '000011', ['rd', 'rt', 'shamt'],    'RI_type'),
+        InstructionSpec('sllv',    'R', '000000', '000100', ['rd', 'rt', 'rs'],       'RI_type'),
+        InstructionSpec('srlv',    'R', '000000', '000110', ['rd', 'rt', 'rs'],       'RI_type'),
+        InstructionSpec('srav',    'R', '000000', '000111', ['rd', 'rt', 'rs'],       'RI_type'),
+        InstructionSpec('jr',      'R', '000000', '001000', ['rs'],                   'RI_type'),
+        InstructionSpec('jalr',    'R', '000000', '001001', ['rd', 'rs'],             'RI_type'),
+        InstructionSpec('syscall', 'R', '000000', '001100', [],                       'RI_type'),
+        InstructionSpec('break',   'R', '000000', '001101', [],                       'RI_type'),
+        InstructionSpec('mfhi',    'R', '000000', '010000', ['rd'],                   'RI_type'),
+        InstructionSpec('mthi',    'R', '000000', '010001', ['rs'],                   'RI_type'),
+        InstructionSpec('mflo',    'R', '000000', '010010', ['rd'],                   'RI_type'),
+        InstructionSpec('mtlo',    'R', '000000', '010011', ['rs'],                   'RI_type'),
+        InstructionSpec('mult',    'R', '000000', '011000', ['rs', 'rt'],             'RI_type'),
+        InstructionSpec('multu',   'R', '000000', '011001', ['rs', 'rt'],             'RI_type'),
+        InstructionSpec('div',     'R', '000000', '011010', ['rs', 'rt'],             'RI_type'),
+        InstructionSpec('divu',    'R', '000000', '011011', ['rs', 'rt'],             'RI_type'),
+        InstructionSpec('add',     'R', '000000', '100000', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('addu',    'R', '000000', '100001', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('sub',     'R', '000000', '100010', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('subu',    'R', '000000', '100011', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('and',     'R', '000000', '100100', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('or',      'R', '000000', '100101', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('xor',     'R', '000000', '100110', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('nor',     'R', '000000', '100111', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('slt',     'R', '000000', '101010', ['rd', 'rs', 'rt'],       'RI_type'),
+        InstructionSpec('sltu',    'R', '000000', '101011', ['rd', 'rs', 'rt'],       'RI_type'),
+
+        # I format - branches
+        InstructionSpec('bltz',    'I', '000001', None,     ['rs', 'label'],          'RI_type', rt='00000'),
+        InstructionSpec('bgez',    'I', '000001', None,     ['rs', 'label'],          'RI_type', rt='00001'),
+        InstructionSpec('beq',     'I', '000100', None,     ['rs', 'rt', 'label'],    'RI_type'),
+        InstructionSpec('bne',     'I', '000101', None,     ['rs', 'rt', 'label'],    'RI_type'),
+        InstructionSpec('blez',    'I', '000110', None,     ['rs', 'label'],          'RI_type'),
+        InstructionSpec('bgtz',    'I', '000111', None,     ['rs', 'label'],          'RI_type'),
+
+        # I format - arithmetic/logical (andi, ori, xori, lui zero-extend)
+        InstructionSpec('addi',    'I', '001000', None,     ['rt', 'rs', 'imm'],      'RI_type'),
+        InstructionSpec('addiu',   'I', '001001', None,     ['rt', 'rs', 'imm'],      'RI_type'),
+        InstructionSpec('slti',    'I', '001010', None,     ['rt', 'rs', 'imm'],      'RI_type'),
+        InstructionSpec('sltiu',   'I', '001011', None,     ['rt', 'rs', 'imm'],      'RI_type'),
+        InstructionSpec('andi',    'I', '001100', None,     ['rt', 'rs', 'imm'],      'RI_type', signed=False),
+        InstructionSpec('ori',     'I', '001101', None,     ['rt', 'rs', 'imm'],      'RI_type', signed=False),
+        InstructionSpec('xori',    'I', '001110', None,     ['rt', 'rs', 'imm'],      'RI_type', signed=False),
+        InstructionSpec('lui',     'I', '001111', None,     ['rt', 'imm'],            'RI_type', signed=False),
+
+        # I format - loads/stores
+        InstructionSpec('lb',      'I', '100000', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('lh',      'I', '100001', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('lwl',     'I', '100010', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('lw',      'I', '100011', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('lbu',     'I', '100100', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('lhu',     'I', '100101', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('lwr',     'I', '100110', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('sb',      'I', '101000', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('sh',      'I', '101001', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('swl',     'I', '101010', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('sw',      'I', '101011', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('swr',     'I', '101110', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('ll',      'I', '110000', None,     ['rt', 'imm', 'rs'],      'load_store'),
+        InstructionSpec('sc',      'I', '111000', None,     ['rt', 'imm', 'rs'],      'load_store'),
+
+        # J format
+        InstructionSpec('j',       'J', '000010', None,     ['label'],                'J_type'),
+        InstructionSpec('jal',     'J', '000011', None,     ['label'],                'J_type'),
+    ]
+
+    # Instruction to opcode mapping, generated from the instruction set
     # Value is dictionary with instruction attribute access (instruction format, opcode, funct code (if applicable))
-    operations = {
-        'nop'   : OpInfo('R', '000000', '000000'),
-        'add'   : OpInfo('R', '000000', '100000'),
-        'addi'  : OpInfo('I', '001000', None),
-        'and'   : OpInfo('R', '000000', '100100'),
-        'beq'   : OpInfo('I', '000100', None),
-        'j'     : OpInfo('J', '000010', None),
-        'jal'   : OpInfo('J', '000011', None),
-        'jr'    : OpInfo('R', '000000', '001000'),
-        'lw'    : OpInfo('I', '100011', '100011'),
-        'or'    : OpInfo('R', '000000', '100101'),
-        'slt'   : OpInfo('R', '000000', '101010'),
-        'sll'   : OpInfo('R', '000000', '000000'),
-        'sw'    : OpInfo('I', '101011', None),
-        'sub'   : OpInfo('R', '000000', '100010'),
-    }
+    operations = dict((spec.mnemonic, spec.op_info()) for spec in instruction_set)
 
     class Instruction(object):
         """
@@ -73,28 +73,28 @@ class Encoder(object):
             """
             return {operand: '$zero' for operand in operands}
 
+        def parse_table(self, instruction_set):
+            """
+            Builds the assembler operation table from the ISA specification,
+            binding each operation to its tokenizer by name.
+            """
+            table = {}
+            for spec in instruction_set:
+                try:
+                    tokenizer = getattr(self, spec.syntax)
+                except AttributeError as e:
+                    raise RuntimeError('Unknown tokenizer: {} for operation: {}'.format(spec.syntax, spec.mnemonic))
+
+                table[spec.mnemonic] = ParseInfo(spec.operands, tokenizer)
+
+            return table
+
     # The assembler operation table defines the parsing rules
     # for a given instruction. The parsing rules are used to
     # map tokens in the instruction string to register address
     # and immediate value positions. (rs, rt, rd, etc)
-    t = tokenizer()
-    operations = {
-        'nop'   : ParseInfo(['rd', 'rs', 'rt'],  t.nop),
-        'add'   : ParseInfo(['rd', 'rs', 'rt'],  t.RI_type),
-        'addi'  : ParseInfo(['rt', 'rs', 'imm'], t.RI_type),
-        'and'   : ParseInfo(['rd', 'rs', 'rt'],  t.RI_type),
-        'beq'   : ParseInfo(['rs', 'rt', 'label'], t.RI_type),
-        'j'     : ParseInfo(['label'],            t.J_type),
-        'jal'   : ParseInfo(['label'],            t.J_type),
-        'jr'    : ParseInfo(['rs'],              t.RI_type),
-        'lw'    : ParseInfo(['rt', 'imm', 'rs'], t.load_store),
-        'or'    : ParseInfo(['rd', 'rs', 'rt'],  t.RI_type),
-        'slt'   : ParseInfo(['rd', 'rs', 'rt'],  t.RI_type),
-        'sll'   : ParseInfo(['rd', 'rt', 'shamt'], t.RI_type),
-        'sw'    : ParseInfo(['rt', 'imm', 'rs'], t.load_store),
-        'sub'   : ParseInfo(['rd', 'rs', 'rt'],  t.RI_type),
-        # TODO ...
-    }
+    # Generated from the ISA specification in MIPS.instruction_set.
+    operations = tokenizer().parse_table(MIPS.instruction_set)
 
     def __init__(self):
         # ISA definitions
@@ -122,7 +122,7 @@ class Encoder(object):
         encoding_map = parse_info.tokenizer(parse_info.tokens, ''.join(data[1:]))
 
         # Get the binary equivalents of the operands and MIPS operation information
-        self.resolve_operands(encoding_map, operation, pc)
+        self.resolve_operands(encoding_map, mips_op_info, pc)
 
         # Pull MIPS operation info into encoding map
         self.resolve_operation_info(encoding_map, mips_op_info)
@@ -137,12 +137,17 @@ class Encoder(object):
         encoding_map['opcode'] = mips_op_info.opcode
         encoding_map['funct'] = mips_op_info.funct
 
-    def resolve_operands(self, encoding_map, operation, pc):
+        # Some operations share an opcode and are distinguished by a fixed rt field (bltz, bgez)
+        if mips_op_info.rt is not None:
+            encoding_map['rt'] = mips_op_info.rt
+
+    def resolve_operands(self, encoding_map, mips_op_info, pc):
         """
         Converts generic register references (such as $t0, $t1, etc), immediate values, and jump addresses
         to their binary equivalents.
         """
         convert = Encoder.to_binary
+        to_int = Encoder.to_int
         branch_replace = False
         jump_replace = False
 
@@ -151,13 +156,13 @@ class Encoder(object):
                 encoding_map[operand] = MIPS.registers[value]
 
             elif (operand == 'imm'):
-                encoding_map[operand] = convert(int(value), MIPS.IMMEDIATE_SIZE)
+                encoding_map[operand] = convert(to_int(value), MIPS.IMMEDIATE_SIZE, mips_op_info.signed)
 
             elif (operand == 'addr'):
-                encoding_map[operand] = convert(int(value), MIPS.ADDRESS_SIZE)
+                encoding_map[operand] = convert(to_int(value), MIPS.ADDRESS_SIZE)
 
             elif (operand == 'shamt'):
-                encoding_map[operand] = convert(int(value), MIPS.SHAMT_SIZE)
+                encoding_map[operand] = convert(to_int(value), MIPS.SHAMT_SIZE, signed=False)
 
             elif (operand == 'label'):
                 label = encoding_map[operand]
@@ -166,23 +171,16 @@ class Encoder(object):
                 if not hit:
                     raise RuntimeError('No address found for label: {}'.format(label))
 
-                if ((operation == 'beq') or (operation == 'bne')):
+                if mips_op_info.format == 'I':
                     # Calculate the relative instruction offset. The MIPS ISA uses
-                    # PC + 4 + (branch offset) to resolve branch targets.
-                    if index > pc:
-                        encoding_map[operand] = convert(index - pc - 1, MIPS.IMMEDIATE_SIZE)
-                    elif index < pc:
-                        encoding_map[operand] = convert((pc + 1) - index, MIPS.IMMEDIATE_SIZE)
-                    else:
-                        # Not sure why a branch would resolve to itself, but ok
-                        # (PC + 4) - 4 = 
-                        encoding_map[operand] = convert(-1, MIPS.IMMEDIATE_SIZE)
-
+                    # PC + 4 + (branch offset) to resolve branch targets, so backward
+                    # branches (and a branch to itself) produce a negative offset.
+                    encoding_map[operand] = convert(index - (pc + 1), MIPS.IMMEDIATE_SIZE)
                     branch_replace = True
 
-                elif ((operation == 'j') or (operation == 'jal')):
+                elif mips_op_info.format == 'J':
                     # Jump addresses are absolute
-                    encoding_map[operand] = convert(index, MIPS.ADDRESS_SIZE)
+                    encoding_map[operand] = convert(index, MIPS.ADDRESS_SIZE, signed=False)
                     jump_replace = True
 
         # Need to convert references to 'label' back to references the instruction
@@ -194,12 +192,29 @@ class Encoder(object):
             encoding_map['addr'] = encoding_map['label']
 
     @staticmethod
-    def to_binary(decimal, length):
+    def to_int(value):
+        """
+        Given an immediate string in decimal or hexadecimal (0x) notation,
+        return the integer value.
+        e.g. to_int('-20') = -20, to_int('0xff') = 255
+        """
+        try:
+            if value.lower().lstrip('-').startswith('0x'):
+                return int(value, 16)
+            return int(value)
+        except ValueError as e:
+            raise RuntimeError('Invalid immediate value: {}'.format(value))
+
+    @staticmethod
+    def to_binary(decimal, length, signed=True):
         """
         Given a decimal, generate the binary equivalent string of
-        given length.
+        given length. Unsigned values are zero-extended.
         e.g. binary(2, 5) = 00010
         """
-        b = bitstring.Bits(int=decimal, length=length)
+        if signed:
+            b = bitstring.Bits(int=decimal, length=length)
+        else:
+            b = bitstring.Bits(uint=decimal, length=length)
         return b.bin
 
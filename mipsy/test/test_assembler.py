@@ -169,3 +169,45 @@ class EncoderTests(unittest.TestCase):
 
     def test_sub(self):
         self.run_test('sub $s3, $t0, $t1', '00000001000010011001100000100010')
+
+    def test_bne(self):
+        self.encoder.label_cache.write('bne_else', 20)
+        self.run_test('bne $t0, $t1, bne_else', '00010101000010010000000000001001', pc=10)
+
+    def test_beq_backward(self):
+        self.encoder.label_cache.write('loop', 5)
+        self.run_test('beq $t0, $zero, loop', '00010001000000001111111111111010', pc=10)
+
+    def test_bgez(self):
+        self.encoder.label_cache.write('bgez_target', 3)
+        self.run_test('bgez $a0, bgez_target', '00000100100000010000000000000010')
+
+    def test_lui(self):
+        self.run_test('lui $t0, 0xffff', '00111100000010001111111111111111')
+
+    def test_ori(self):
+        self.run_test('ori $t0, $t0, 0x8000', '00110101000010001000000000000000')
+
+    def test_srl(self):
+        self.run_test('srl $t1, $t1, 31', '00000000000010010100111111000010')
+
+    def test_sra(self):
+        self.run_test('sra $t1, $t2, 4', '00000000000010100100100100000011')
+
+    def test_mult(self):
+        self.run_test('mult $s0, $s1', '00000010000100010000000000011000')
+
+    def test_mfhi(self):
+        self.run_test('mfhi $t0', '00000000000000000100000000010000')
+
+    def test_lb(self):
+        self.run_test('lb $t0, -4($sp)', '10000011101010001111111111111100')
+
+    def test_sb(self):
+        self.run_test('sb $t0, 3($a0)', '10100000100010000000000000000011')
+
+    def test_jalr(self):
+        self.run_test('jalr $ra, $t9', '00000011001000001111100000001001')
+
+    def test_syscall(self):
+        self.run_test('syscall', '00000000000000000000000000001100')
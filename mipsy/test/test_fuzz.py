@@ -0,0 +1,175 @@
+"""
+Randomized round-trip tests for the full instruction set.
+
+Every operation in MIPS.instruction_set is exercised with random valid operands.
+The encoder output is decoded field by field and checked against values computed
+independently of the encoder.
+
+Set MIPSY_FUZZ_ITERATIONS to run a longer session (e.g. 1000000) and
+MIPSY_FUZZ_SEED to reproduce a failure.
+"""
+
+# system imports
+import os
+import random
+import unittest
+
+# application imports
+from mipsy.arch import MIPS
+from mipsy.encoder import Encoder
+from mipsy.util import LabelCache
+
+
+# Register names in register number order
+REGISTER_NAMES = [
+    '$zero', '$at', '$v0', '$v1', '$a0', '$a1', '$a2', '$a3',
+    '$t0',   '$t1', '$t2', '$t3', '$t4', '$t5', '$t6', '$t7',
+    '$s0',   '$s1', '$s2', '$s3', '$s4', '$s5', '$s6', '$s7',
+    '$t8',   '$t9', '$k0', '$k1', '$gp', '$sp', '$fp', '$ra',
+]
+
+# Bit slices of each field, per instruction format
+FIELDS = {
+    'R': [('opcode', 0, 6), ('rs', 6, 11), ('rt', 11, 16), ('rd', 16, 21), ('shamt', 21, 26), ('funct', 26, 32)],
+    'I': [('opcode', 0, 6), ('rs', 6, 11), ('rt', 11, 16), ('imm', 16, 32)],
+    'J': [('opcode', 0, 6), ('addr', 6, 32)],
+}
+
+
+class ISASpecTests(unittest.TestCase):
+    """
+    Sanity checks on the ISA specification and the tables generated from it.
+    """
+
+    def test_tables_generated(self):
+        mnemonics = set(spec.mnemonic for spec in MIPS.instruction_set)
+        self.assertEqual(len(mnemonics), len(MIPS.instruction_set), msg='duplicate mnemonic in instruction set')
+        self.assertEqual(mnemonics, set(MIPS.operations))
+        self.assertEqual(mnemonics, set(Encoder.operations))
+
+    def test_encodings_unique(self):
+        """ No two operations (other than the nop alias) may share an encoding. """
+        seen = {}
+        for spec in MIPS.instruction_set:
+            if spec.syntax == 'nop':
+                continue
+
+            key = FuzzTests.decode_key(spec.format, spec.opcode, spec.funct, spec.rt)
+            self.assertNotIn(key, seen, msg='{} collides with {}'.format(spec.mnemonic, seen.get(key)))
+            seen[key] = spec.mnemonic
+
+    def test_funct_only_for_r_format(self):
+        for spec in MIPS.instruction_set:
+            if spec.format == 'R':
+                self.assertIsNotNone(spec.funct, msg=spec.mnemonic)
+            else:
+                self.assertIsNone(spec.funct, msg=spec.mnemonic)
+
+
+class FuzzTests(unittest.TestCase):
+    """
+    Encodes random valid instructions and checks every field of the result.
+    """
+
+    iterations = int(os.environ.get('MIPSY_FUZZ_ITERATIONS', 5000))
+    seed = int(os.environ.get('MIPSY_FUZZ_SEED', random.randrange(2 ** 32)))
+
+    encoder = Encoder()
+    cache = LabelCache()
+
+    def setUp(self):
+        self.cache.empty()
+        self.random = random.Random(self.seed)
+        self.specs = [spec for spec in MIPS.instruction_set if spec.syntax != 'nop']
+        self.decode_table = dict(
+            (FuzzTests.decode_key(spec.format, spec.opcode, spec.funct, spec.rt), spec.mnemonic)
+            for spec in self.specs)
+
+        # Opcodes whose operation is selected by the rt field (bltz, bgez)
+        self.rt_opcodes = set(spec.opcode for spec in self.specs if spec.rt is not None)
+
+    def tearDown(self):
+        self.cache.empty()
+
+    @staticmethod
+    def decode_key(format, opcode, funct, rt):
+        """ Returns the fields that identify an operation. """
+        if format == 'R':
+            return (opcode, funct)
+        return (opcode, rt)
+
+    def immediate(self, value):
+        """ Formats an immediate in either decimal or hexadecimal notation. """
+        if self.random.random() < 0.5:
+            return str(value)
+        return '-0x{:x}'.format(-value) if value < 0 else '0x{:x}'.format(value)
+
+    def generate(self, spec):
+        """
+        Returns (pc, instruction string, expected field values) for a random
+        instance of the given operation.
+        """
+        r = self.random
+        pc = r.randrange(2 ** 16)
+        expected = dict((name, 0) for name, _, _ in FIELDS[spec.format])
+        expected['opcode'] = int(spec.opcode, 2)
+        if spec.funct is not None:
+            expected['funct'] = int(spec.funct, 2)
+        if spec.rt is not None:
+            expected['rt'] = int(spec.rt, 2)
+
+        tokens = {}
+        for operand in spec.operands:
+            if operand in ('rs', 'rt', 'rd'):
+                number = r.randrange(32)
+                tokens[operand] = REGISTER_NAMES[number]
+                expected[operand] = number
+
+            elif operand == 'shamt':
+                expected['shamt'] = r.randrange(32)
+                tokens[operand] = str(expected['shamt'])
+
+            elif operand == 'imm':
+                value = r.randrange(-2 ** 15, 2 ** 15) if spec.signed else r.randrange(2 ** 16)
+                tokens[operand] = self.immediate(value)
+                expected['imm'] = value & 0xffff
+
+            elif operand == 'label' and spec.format == 'I':
+                offset = r.randrange(-2 ** 15, 2 ** 15)
+                pc = r.randrange(max(0, -offset - 1), 2 ** 16)
+                index = pc + 1 + offset
+                tokens[operand] = 'fuzz_{}'.format(index)
+                self.cache.write(tokens[operand], index)
+                expected['imm'] = offset & 0xffff
+
+            elif operand == 'label' and spec.format == 'J':
+                index = r.randrange(2 ** 26)
+                tokens[operand] = 'fuzz_{}'.format(index)
+                self.cache.write(tokens[operand], index)
+                expected['addr'] = index
+
+        values = [tokens[operand] for operand in spec.operands]
+        if spec.syntax == 'load_store':
+            instr = '{} {}, {}({})'.format(spec.mnemonic, *values)
+        else:
+            instr = '{} {}'.format(spec.mnemonic, ', '.join(values)).strip()
+
+        return pc, instr, expected
+
+    def test_round_trip(self):
+        for i in range(self.iterations):
+            spec = self.random.choice(self.specs)
+            pc, instr, expected = self.generate(spec)
+            result = self.encoder.encode_instruction(pc, instr)
+
+            context = 'instr: "{}" pc: {} result: {} seed: {}'.format(instr, pc, result, self.seed)
+            self.assertEqual(MIPS.WORD_SIZE, len(result), msg=context)
+
+            decoded = dict((name, int(result[start:end], 2)) for name, start, end in FIELDS[spec.format])
+            for name, value in expected.items():
+                self.assertEqual(value, decoded[name], msg='field: {} {}'.format(name, context))
+
+            opcode = result[0:6]
+            key = FuzzTests.decode_key(spec.format, opcode, result[26:32],
+                result[11:16] if opcode in self.rt_opcodes else None)
+            self.assertEqual(spec.mnemonic, self.decode_table.get(key), msg=context)
@@ -12,10 +12,12 @@ class OpInfo(object):
     This is the operation information immediately available upon reference
     to the MIPS reference card.
     """
-    def __init__(self, format, opcode, funct):
+    def __init__(self, format, opcode, funct, rt=None, signed=True):
         self.format = format
         self.opcode = opcode
         self.funct = funct
+        self.rt = rt
+        self.signed = signed
 
 
 class ParseInfo(object):
@@ -27,6 +29,30 @@ class ParseInfo(object):
         self.tokenizer = tokenizer
 
 
+class InstructionSpec(object):
+    """
+    A single row of the ISA specification.
+    Combines the reference card information (format, opcode, funct) with the
+    assembler syntax (operand order and tokenizer name) for one operation.
+
+    rt is a fixed rt field value (e.g. bltz/bgez share an opcode and differ in rt).
+    signed is False for operations that zero-extend their immediate (andi, ori, lui, ...).
+    """
+    def __init__(self, mnemonic, format, opcode, funct, operands, syntax, rt=None, signed=True):
+        self.mnemonic = mnemonic
+        self.format = format
+        self.opcode = opcode
+        self.funct = funct
+        self.operands = operands
+        self.syntax = syntax
+        self.rt = rt
+        self.signed = signed
+
+    def op_info(self):
+        """ Returns the OpInfo used during encoding. """
+        return OpInfo(self.format, self.opcode, self.funct, self.rt, self.signed)
+
+
 class Singleton(type):
     """
     Common singleton pattern utilizing Python's "metaclass" attribute.